@@ -59,6 +59,14 @@ def main():
         print(f"Error: Cast file '{cast_path}' not found")
         sys.exit(1)
 
+    # Use uvloop's faster event loop for playback when available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     app = AsciinemaApp(str(cast_path))
     app.run()
 
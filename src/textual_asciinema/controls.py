@@ -1,5 +1,7 @@
 """Player controls widget for asciinema player."""
 
+from functools import lru_cache
+
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widget import Widget
@@ -8,6 +10,26 @@ from textual.reactive import reactive
 from textual.events import Click, MouseScrollUp, MouseScrollDown
 
 
+# Allowed playback speeds, 0.1x to 5.0x; keypresses step an index through
+# this table instead of accumulating 0.1 floats (which drifts: 0.1 * 3 != 0.3)
+_SPEEDS = tuple(round(x * 0.1, 1) for x in range(1, 51))
+_DEFAULT_SPEED_IDX = _SPEEDS.index(1.0)
+
+# Window for coalescing scroll-wheel notches into a single seek
+SCROLL_COALESCE_WINDOW = 0.03
+
+
+@lru_cache(maxsize=4096)
+def _format_seconds(total_seconds: int) -> str:
+    """Format whole seconds as HH:MM:SS, cached per displayed second."""
+    minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    else:
+        return f"{minutes:02d}:{seconds:02d}"
+
+
 class TimeBar(Widget):
     current_time = reactive(0.0)
     can_focus = False  # Prevent text selection
@@ -18,6 +40,8 @@ class TimeBar(Widget):
         self.step = step
         self.on_seek = None  # Callback: new time
         self.on_play_pause = None  # Callback: play/pause
+        self._pending_delta = 0.0
+        self._flush_timer = None
 
     def render(self):
         width = self.size.width
@@ -46,10 +70,30 @@ class TimeBar(Widget):
             self.on_seek(new_time)
 
     def on_mouse_scroll_up(self, event: MouseScrollUp):
-        self._seek_delta(+self.step)
+        self._queue_scroll(+self.step)
 
     def on_mouse_scroll_down(self, event: MouseScrollDown):
-        self._seek_delta(-self.step)
+        self._queue_scroll(-self.step)
+
+    def _queue_scroll(self, delta: float):
+        """Coalesce scroll notches so a wheel spin issues one seek.
+
+        A fast spin delivers several notches within milliseconds; seeking
+        once per notch replays from a keyframe every time. Deltas accumulate
+        and flush after a short window (immediately when not mounted, where
+        no timer can run).
+        """
+        self._pending_delta += delta
+        if not self.is_mounted:
+            self._flush_scroll()
+        elif self._flush_timer is None:
+            self._flush_timer = self.set_timer(SCROLL_COALESCE_WINDOW, self._flush_scroll)
+
+    def _flush_scroll(self) -> None:
+        delta, self._pending_delta = self._pending_delta, 0.0
+        self._flush_timer = None
+        if delta:
+            self._seek_delta(delta)
 
     def _seek_delta(self, delta: float):
         new_time = max(0.0, min(self.current_time + delta, self.max_time))
@@ -68,6 +112,9 @@ class PlayerControls(Widget):
     def __init__(self, duration: float, **kwargs):
         super().__init__(**kwargs)
         self.duration = duration
+        self._duration_formatted = _format_seconds(int(duration))
+        self._last_display_second = -1
+        self._speed_idx = _DEFAULT_SPEED_IDX
         self.on_play_pause = None
         self.on_seek = None
         self.on_speed_change = None
@@ -83,24 +130,22 @@ class PlayerControls(Widget):
     def _format_time_display(self) -> str:
         """Format the current time and duration for display."""
         current_formatted = self._format_time(self.current_time)
-        duration_formatted = self._format_time(self.duration)
-        return f"{current_formatted} / {duration_formatted}"
+        return f"{current_formatted} / {self._duration_formatted}"
 
     def _format_time(self, seconds: float) -> str:
         """Format seconds as HH:MM:SS."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        seconds = int(seconds % 60)
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
-        else:
-            return f"{minutes:02d}:{seconds:02d}"
+        return _format_seconds(int(seconds))
 
     def watch_current_time(self, new_time: float) -> None:
         """React to time changes."""
         if self.is_mounted:
             try:
-                self.query_one("#time-display", Label).update(self._format_time_display())
+                # The label only resolves to whole seconds, so skip its
+                # redraw until the displayed second actually changes
+                display_second = int(new_time)
+                if display_second != self._last_display_second:
+                    self._last_display_second = display_second
+                    self.query_one("#time-display", Label).update(self._format_time_display())
                 time_bar = self.query_one("#timeline-scrubber", TimeBar)
                 time_bar.current_time = new_time
             except Exception:
@@ -119,6 +164,9 @@ class PlayerControls(Widget):
 
     def watch_speed(self, new_speed: float) -> None:
         """React to speed changes."""
+        # Keep the step index in sync when speed is set directly; the table
+        # is uniform 0.1 steps so the index is just arithmetic
+        self._speed_idx = max(0, min(round(new_speed * 10) - 1, len(_SPEEDS) - 1))
         if self.is_mounted:
             try:
                 self.query_one("#speed-display", Label).update(f"{new_speed:.1f}x")
@@ -158,35 +206,52 @@ class PlayerControls(Widget):
         """Update the current time (called by playback engine)."""
         self.current_time = current_time
 
+    def _key_seek_backward(self) -> None:
+        """Seek backward 1 second."""
+        target_time = max(0, self.current_time - 1)
+        if self.on_seek:
+            self.on_seek(target_time)
+
+    def _key_seek_forward(self) -> None:
+        """Seek forward 1 second."""
+        target_time = min(self.duration, self.current_time + 1)
+        if self.on_seek:
+            self.on_seek(target_time)
+
+    def _step_speed(self, delta: int) -> None:
+        """Step the speed index through the precomputed table."""
+        idx = max(0, min(len(_SPEEDS) - 1, self._speed_idx + delta))
+        if idx == self._speed_idx:
+            return
+        self._speed_idx = idx
+        new_speed = _SPEEDS[idx]
+        self.speed = new_speed
+        if self.on_speed_change:
+            self.on_speed_change(new_speed)
+
+    def _key_speed_down(self) -> None:
+        """Decrease speed by 0.1."""
+        self._step_speed(-1)
+
+    def _key_speed_up(self) -> None:
+        """Increase speed by 0.1."""
+        self._step_speed(+1)
+
+    # Keyboard shortcut dispatch table; minus/plus appear with and without
+    # shift depending on the keyboard layout
+    _KEY_HANDLERS = {
+        "space": _handle_play_pause,
+        "left": _key_seek_backward,
+        "right": _key_seek_forward,
+        "minus": _key_speed_down,
+        "underscore": _key_speed_down,
+        "plus": _key_speed_up,
+        "equals": _key_speed_up,
+    }
+
     def on_key(self, event) -> None:
-        """Handle keyboard shortcuts."""
-        if event.key == "space":
-            # Play/pause
-            self._handle_play_pause()
-            event.prevent_default()
-        elif event.key == "left":
-            # Seek backward 1 second
-            target_time = max(0, self.current_time - 1)
-            if self.on_seek:
-                self.on_seek(target_time)
-            event.prevent_default()
-        elif event.key == "right":
-            # Seek forward 1 second
-            target_time = min(self.duration, self.current_time + 1)
-            if self.on_seek:
-                self.on_seek(target_time)
-            event.prevent_default()
-        elif event.key in ["minus", "underscore"]:  # minus key (with or without shift)
-            # Decrease speed by 0.1
-            new_speed = max(0.1, self.speed - 0.1)
-            self.speed = new_speed
-            if self.on_speed_change:
-                self.on_speed_change(new_speed)
-            event.prevent_default()
-        elif event.key in ["plus", "equals"]:  # plus key (with or without shift)
-            # Increase speed by 0.1
-            new_speed = min(5.0, self.speed + 0.1)
-            self.speed = new_speed
-            if self.on_speed_change:
-                self.on_speed_change(new_speed)
+        """Handle keyboard shortcuts with a single dict lookup."""
+        handler = self._KEY_HANDLERS.get(event.key)
+        if handler is not None:
+            handler(self)
             event.prevent_default()
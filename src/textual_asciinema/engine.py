@@ -9,11 +9,18 @@ if TYPE_CHECKING:
     from textual_tty import TextualTerminal
 
 from .parser import CastParser
-from .video_file import VideoFile
+from .video_file import KEYFRAME_INTERVAL, VideoFile
 
-# Set up debug logging
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+
+# Seeks closer together than this are treated as continuous scrubbing
+SCRUB_WINDOW_NS = 500_000_000
+
+# Minimum interval between on_time_update callbacks during playback
+TIME_UPDATE_INTERVAL_NS = 50_000_000
+
+# Target render interval (60fps)
+FRAME_TIME_NS = 16_000_000
 
 
 class PlaybackEngine:
@@ -30,7 +37,19 @@ class PlaybackEngine:
         self.current_time = 0.0
         self.is_playing = False
         self.speed = 1.0
-        self.last_update_time = 0.0
+        self._last_seek_ns = 0
+        self._last_time_update_ns = 0
+
+        # Serializes seeks: AsciinemaPlayer dispatches each seek on its own
+        # worker, and two replays interleaving on one file handle would
+        # corrupt reads and keyframe offsets
+        self._seek_lock = asyncio.Lock()
+
+        # Clock anchor: cast time _epoch_cast corresponds to monotonic time
+        # _epoch_mono_ns, so position is derived rather than accumulated;
+        # interval checks stay in integer nanoseconds
+        self._epoch_mono_ns = 0
+        self._epoch_cast = 0.0
 
         # UI callback
         self.on_time_update: Optional[Callable[[float], None]] = None
@@ -38,15 +57,29 @@ class PlaybackEngine:
         # Playback task
         self._playback_task: Optional[asyncio.Task] = None
 
+        # Reusable batch buffer for _feed_frames, cleared rather than
+        # reallocated on every tick
+        self._feed_parts: list[str] = []
+
     async def play(self) -> None:
         """Start or resume playback."""
         if self.is_playing:
             return
 
+        # Warm the frame index and duration in a worker thread so the first
+        # tick doesn't block the event loop on a full-file scan
+        await asyncio.to_thread(lambda: self.parser.duration)
+
         self.is_playing = True
-        self.last_update_time = time.time()
+        self._epoch_mono_ns = time.monotonic_ns()
+        self._epoch_cast = self.current_time
 
         if self._playback_task is None or self._playback_task.done():
+            # Eager tasks (3.12+) start the loop synchronously, skipping a
+            # scheduling round-trip on every play/resume
+            loop = asyncio.get_running_loop()
+            if hasattr(asyncio, "eager_task_factory") and loop.get_task_factory() is None:
+                loop.set_task_factory(asyncio.eager_task_factory)
             self._playback_task = asyncio.create_task(self._playback_loop())
 
     async def pause(self) -> None:
@@ -68,83 +101,155 @@ class PlaybackEngine:
 
     def set_speed(self, speed: float) -> None:
         """Set playback speed multiplier."""
+        # Rebase the clock anchor so already-elapsed time keeps its old speed
+        self._epoch_cast = self.current_time
+        self._epoch_mono_ns = time.monotonic_ns()
         self.speed = speed
 
     async def seek_to(self, timestamp: float) -> None:
-        """Seek to a specific timestamp."""
+        """Seek to a specific timestamp.
+
+        Concurrent calls queue on the seek lock - the replay runs in a
+        worker thread against the shared file handle, so a second seek
+        must not start until the first has landed.
+        """
+        async with self._seek_lock:
+            await self._seek_to_locked(timestamp)
+
+    async def _seek_to_locked(self, timestamp: float) -> None:
+        """Perform a seek; caller holds the seek lock."""
         timestamp = max(0.0, min(timestamp, self.parser.duration))
 
+        # During continuous scrubbing, snap to the nearest keyframe so each
+        # notch skips the decode-and-replay between keyframe and target
+        now_ns = time.monotonic_ns()
+        scrubbing = (now_ns - self._last_seek_ns) < SCRUB_WINDOW_NS
+        self._last_seek_ns = now_ns
+        if scrubbing:
+            keyframe = self.video_file._find_nearest_keyframe(timestamp)
+            if keyframe is not None and abs(timestamp - keyframe.timestamp) <= KEYFRAME_INTERVAL:
+                # Never snap a forward seek back to or behind the current
+                # position: each seek warms a keyframe at its landing
+                # point, so held-down forward seeking would freeze there
+                if timestamp <= self.current_time or keyframe.timestamp > self.current_time:
+                    timestamp = keyframe.timestamp
+
         was_playing = self.is_playing
         await self.pause()
 
-        # Clear terminal and seek video file
+        # Clear terminal, seek video file and replay up to the target; the
+        # read and JSON decode run in a worker thread so a long replay
+        # doesn't stall the UI
         self.terminal.clear_screen()
-        self.video_file.seek_to_time(timestamp)
-
-        # Update UI time
+        seek_started = time.monotonic()
+        keyframe, frames = await asyncio.to_thread(self.video_file.seek_to_time, timestamp)
+        repainted = False
+        if keyframe is not None and keyframe.snapshot:
+            # Repaint the captured screen instead of replaying from scratch
+            self.terminal.parser.feed(keyframe.snapshot.replace("\n", "\r\n"))
+            repainted = True
+        if self._feed_frames(frames) or repainted:
+            await self.terminal._update_display()
+
+        # Feed the measured replay cost back into the keyframe density, and
+        # pre-warm a keyframe at the landing point for follow-up scrubs
+        self.video_file.adapt_keyframe_interval(time.monotonic() - seek_started)
+        self.video_file.warm_keyframe_here(self.terminal.capture_pane)
+
+        # Update UI time; seeks report immediately rather than debounced
         self.current_time = timestamp
 
         if self.on_time_update:
+            self._last_time_update_ns = time.monotonic_ns()
             self.on_time_update(self.current_time)
 
         if was_playing:
             await self.play()
 
+    def _feed_frames(self, frames) -> bool:
+        """Feed a batch of frames to the terminal in one coalesced write.
+
+        Output data is joined into a single feed() call, flushed early only
+        around resize events to preserve ordering. Returns True if anything
+        changed the display.
+        """
+        terminal = self.terminal
+        parts = self._feed_parts
+        has_output = False
+        for frame in frames:
+            if frame.stream_type == "o":
+                parts.append(frame.data)
+                has_output = True
+            elif frame.stream_type == "r":
+                if parts:
+                    terminal.parser.feed("".join(parts))
+                    parts.clear()
+                try:
+                    cols, rows = map(int, frame.data.split("x"))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Resize event at {frame.timestamp:.3f}: {cols}x{rows}")
+                    terminal.resize(cols, rows)
+                    has_output = True
+                except (ValueError, AttributeError) as e:
+                    logger.warning(f"Failed to parse resize data '{frame.data}': {e}")
+
+        if parts:
+            terminal.parser.feed("".join(parts))
+            parts.clear()
+        return has_output
+
     async def _playback_loop(self) -> None:
         """Simple video player loop - streams frames to terminal."""
         try:
-            frame_time = 0.016  # Target 60fps
-            last_render_time = 0.0
+            last_render_ns = 0
 
-            while self.is_playing:
-                current_real_time = time.time()
+            # Hoist hot attribute lookups out of the loop
+            duration = self.parser.duration
+            terminal = self.terminal
+            video_file = self.video_file
+            monotonic_ns = time.monotonic_ns
 
-                # Calculate how much cast time has passed
-                if self.last_update_time > 0:
-                    real_time_delta = current_real_time - self.last_update_time
-                    cast_time_delta = real_time_delta * self.speed
-                    self.current_time += cast_time_delta
+            while self.is_playing:
+                current_ns = monotonic_ns()
 
-                self.last_update_time = current_real_time
+                # Derive position from the clock anchor instead of summing
+                # per-tick deltas, so scheduling error can't accumulate
+                self.current_time = self._epoch_cast + (current_ns - self._epoch_mono_ns) * 1e-9 * self.speed
 
                 # Skip frames if we're falling behind (only render at target framerate)
-                time_since_last_render = current_real_time - last_render_time
-                if time_since_last_render >= frame_time:
+                if current_ns - last_render_ns >= FRAME_TIME_NS:
                     # Get frames up to current time and feed to terminal
-                    frames = self.video_file.get_frames_until(self.current_time)
-                    has_output = False
-                    for frame in frames:
-                        if frame.stream_type == "o":
-                            # Feed output data to terminal
-                            self.terminal.parser.feed(frame.data)
-                            has_output = True
-                        elif frame.stream_type == "r":
-                            # Handle resize events
-                            try:
-                                cols, rows = map(int, frame.data.split("x"))
-                                logger.debug(f"Resize event at {frame.timestamp:.3f}: {cols}x{rows}")
-                                self.terminal.resize(cols, rows)
-                                has_output = True
-                            except (ValueError, AttributeError) as e:
-                                logger.warning(f"Failed to parse resize data '{frame.data}': {e}")
+                    frames = video_file.get_frames_until(self.current_time)
 
                     # Trigger display update if we had any output
-                    if has_output:
-                        await self.terminal._update_display()
+                    if frames and self._feed_frames(frames):
+                        await terminal._update_display()
+
+                    # Snapshot the screen here if a keyframe is due - the
+                    # terminal now reflects everything up to current_time
+                    video_file.maybe_create_keyframe(terminal.capture_pane)
 
-                    last_render_time = current_real_time
+                    last_render_ns = current_ns
 
-                    # Update time display
-                    if self.on_time_update:
+                    # Update time display, debounced so the reactive chain in
+                    # the controls runs at most every 50ms
+                    if self.on_time_update and current_ns - self._last_time_update_ns >= TIME_UPDATE_INTERVAL_NS:
+                        self._last_time_update_ns = current_ns
                         self.on_time_update(self.current_time)
 
                 # Check if we've reached the end
-                if self.current_time >= self.parser.duration:
+                if self.current_time >= duration:
                     self.is_playing = False
                     break
 
-                # Small delay to prevent busy waiting
-                await asyncio.sleep(0.008)  # 125Hz polling for smoother timing
+                # Sleep until the next frame is due instead of polling at a
+                # fixed rate; cap the wait so pause/seek stay responsive
+                sleep_for = (FRAME_TIME_NS - (monotonic_ns() - last_render_ns)) * 1e-9
+                next_time = video_file.next_frame_time
+                if next_time is not None:
+                    wait = (next_time - self.current_time) / self.speed
+                    sleep_for = max(sleep_for, min(wait, 0.05))
+                await asyncio.sleep(max(0.0, min(sleep_for, 0.05)))
 
         except asyncio.CancelledError:
             raise
@@ -155,7 +260,8 @@ class PlaybackEngine:
     def reset(self) -> None:
         """Reset playback to the beginning."""
         self.current_time = 0.0
-        self.last_update_time = 0.0
+        self._epoch_mono_ns = time.monotonic_ns()
+        self._epoch_cast = 0.0
 
         # Clear terminal and reset video file
         self.terminal.clear_screen()
@@ -1,13 +1,92 @@
 """Parser for asciinema cast files."""
 
+import bisect
 import gzip
+import hashlib
+import io
 import json
+import mmap
 import os
+import shutil
+import struct
 import tempfile
+from array import array
 from pathlib import Path
 from typing import Iterator, NamedTuple, Optional, Tuple
 from platformdirs import user_cache_dir
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    # json.loads accepts bytes directly, so no decode round-trip either way
+    _loads = json.loads
+
+# Block size for batched line reads during full-file scans
+SCAN_BLOCK_SIZE = 256 * 1024
+
+# Sidecar index file format: magic, then count/mtime_ns/size, then the
+# timestamp and offset arrays back to back
+INDEX_MAGIC = b"TACIDX1\n"
+INDEX_HEADER = struct.Struct("<qqq")
+
+# Most index sidecars kept in the cache directory before pruning
+INDEX_CACHE_LIMIT = 256
+
+
+def _iter_lines(f) -> Iterator[bytes]:
+    """Yield lines from the current position using fixed-size block reads.
+
+    One read per block instead of one readline call per frame; a tail
+    buffer carries partial lines across block boundaries. Works on both
+    plain handles and mmaps.
+    """
+    tail = b""
+    while block := f.read(SCAN_BLOCK_SIZE):
+        lines = (tail + block).split(b"\n")
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+
+def _iter_lines_with_offsets(f, start: int) -> Iterator[Tuple[int, bytes]]:
+    """Like _iter_lines, tracking each line's byte offset arithmetically."""
+    offset = start
+    tail = b""
+    while block := f.read(SCAN_BLOCK_SIZE):
+        lines = (tail + block).split(b"\n")
+        tail = lines.pop()
+        for line in lines:
+            yield offset, line
+            offset += len(line) + 1
+    if tail:
+        yield offset, tail
+
+
+def _frame_timestamp(line: bytes) -> float:
+    """Timestamp of a frame line without a full JSON decode.
+
+    Every frame is [<number>, "<type>", "<data>"], so the timestamp is
+    the text between the opening bracket and the first comma; anything
+    that doesn't parse falls back to the real decoder.
+    """
+    try:
+        return float(line[1 : line.index(b",")])
+    except ValueError:
+        return _loads(line)[0]
+
+
+def _advise_sequential(file_obj) -> None:
+    """Hint the kernel to read ahead aggressively for a sequential scan."""
+    try:
+        if isinstance(file_obj, mmap.mmap):
+            if hasattr(file_obj, "madvise"):
+                file_obj.madvise(mmap.MADV_SEQUENTIAL)
+        elif hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(file_obj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (OSError, ValueError):
+        pass  # Best-effort hint only
+
 
 class CastHeader(NamedTuple):
     """Metadata from the cast file header."""
@@ -51,6 +130,10 @@ class CastParser:
         self.cast_path = Path(cast_path)
         self._header = None
         self._duration = None
+        self._frame_index: Optional[list[tuple[float, int]]] = None
+        self._index_times: Optional[array] = None
+        self._index_offsets: Optional[array] = None
+        self._fast_forward_table: Optional[list[int]] = None
         self._is_gzipped = str(cast_path).endswith(".gz")
         self._working_file_path: Optional[Path] = None
         self._temp_cache_file = False
@@ -89,9 +172,14 @@ class CastParser:
         temp_path = Path(temp_path)
 
         try:
+            # Stream through 1 MiB buffers rather than loading the whole
+            # decompressed cast into memory; the large read buffer also
+            # keeps GzipFile from issuing many small reads on the raw file
             with os.fdopen(fd, "wb") as temp_file:
-                with gzip.open(self.cast_path, "rb") as gz_file:
-                    temp_file.write(gz_file.read())
+                with open(self.cast_path, "rb", buffering=0) as raw:
+                    buffered = io.BufferedReader(raw, buffer_size=1 << 20)
+                    with gzip.GzipFile(fileobj=buffered) as gz_file:
+                        shutil.copyfileobj(gz_file, temp_file, 1 << 20)
         except Exception:
             # Clean up on error
             if temp_path.exists():
@@ -114,59 +202,211 @@ class CastParser:
             self._duration = self._calculate_duration()
         return self._duration
 
+    def _open_working_file(self):
+        """Open the working file for scanning, memory-mapped when possible.
+
+        mmap lets repeated scans hit the page cache directly instead of
+        copying through read buffers; the mapping is virtual, so size
+        doesn't matter - pages fault in on demand. Empty or unmappable
+        files fall back to a plain handle.
+        """
+        f = open(self._working_file_path, "rb")
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            f.close()
+            return mapped
+        except (OSError, ValueError):
+            pass  # Empty or unmappable file - use the plain handle
+        return f
+
+    def _ensure_index(self) -> None:
+        """Build or load the parallel timestamp/offset index arrays.
+
+        Stored as two packed arrays rather than a list of tuples - half
+        the memory on long casts and the layout the sidecar file already
+        uses, so loading is a straight fromfile.
+        """
+        if self._index_times is not None:
+            return
+        loaded = self._load_index_cache()
+        if loaded is None:
+            # Raw scan without CastFrame construction - the index only
+            # needs each frame's timestamp, not a frame object per line
+            times = array("d")
+            offsets = array("q")
+            with self._open_working_file() as f:
+                _advise_sequential(f)
+                f.readline()  # Skip header
+                for offset, line in _iter_lines_with_offsets(f, f.tell()):
+                    stripped = line.strip()
+                    if stripped:
+                        times.append(_frame_timestamp(stripped))
+                        offsets.append(offset)
+            self._index_times, self._index_offsets = times, offsets
+            self._save_index_cache()
+        else:
+            self._index_times, self._index_offsets = loaded
+
+    @property
+    def frame_index(self) -> list:
+        """Sorted (timestamp, byte offset) pairs for every frame, built once.
+
+        A zipped view over the index arrays, kept for callers that want
+        pairs; the hot lookup paths bisect the arrays directly.
+        """
+        if self._frame_index is None:
+            self._ensure_index()
+            self._frame_index = list(zip(self._index_times, self._index_offsets))
+        return self._frame_index
+
+    def index_arrays(self) -> tuple:
+        """The index columns themselves: (timestamps, byte offsets).
+
+        Two parallel packed arrays sorted by timestamp - the zero-copy
+        form for callers that bisect or slice columns and never need
+        per-frame pair tuples.
+        """
+        self._ensure_index()
+        return self._index_times, self._index_offsets
+
+    def _index_cache_path(self) -> Path:
+        """Cache file for the persisted frame index, keyed on the cast path."""
+        digest = hashlib.sha1(str(self.cast_path.resolve()).encode()).hexdigest()
+        return Path(user_cache_dir("textual-asciinema")) / f"{digest}.idx"
+
+    def _load_index_cache(self) -> Optional[tuple]:
+        """Load the persisted index arrays, or None if missing or stale."""
+        try:
+            st = self.cast_path.stat()
+            with open(self._index_cache_path(), "rb") as f:
+                if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                    return None
+                count, mtime_ns, size = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+                if mtime_ns != st.st_mtime_ns or size != st.st_size:
+                    return None
+                timestamps = array("d")
+                offsets = array("q")
+                timestamps.fromfile(f, count)
+                offsets.fromfile(f, count)
+            return timestamps, offsets
+        except (OSError, EOFError, struct.error):
+            return None
+
+    def _save_index_cache(self) -> None:
+        """Write the frame index sidecar; best-effort, failures are ignored."""
+        try:
+            st = self.cast_path.stat()
+            cache_path = self._index_cache_path()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(suffix=".idx", dir=cache_path.parent)
+            with os.fdopen(fd, "wb") as f:
+                f.write(INDEX_MAGIC)
+                f.write(INDEX_HEADER.pack(len(self._index_times), st.st_mtime_ns, st.st_size))
+                self._index_times.tofile(f)
+                self._index_offsets.tofile(f)
+            os.replace(temp_path, cache_path)
+            self._prune_index_cache(cache_path.parent)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _prune_index_cache(cache_dir: Path) -> None:
+        """Drop the oldest sidecars once the cache holds too many.
+
+        Deleted casts leave their sidecars behind with nothing else to
+        evict them, so the directory is bounded by count, oldest first.
+        """
+        try:
+            sidecars = sorted(cache_dir.glob("*.idx"), key=os.path.getmtime)
+        except OSError:
+            return
+        for stale in sidecars[: max(len(sidecars) - INDEX_CACHE_LIMIT, 0)]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+    @property
+    def fast_forward_table(self) -> list:
+        """Positions into the index of the first frame at or after each whole second."""
+        if self._fast_forward_table is None:
+            self._ensure_index()
+            times = self._index_times
+            table = []
+            pos = 0
+            total = len(times)
+            seconds = int(times[-1]) + 1 if times else 0
+            for second in range(seconds + 1):
+                while pos < total and times[pos] < second:
+                    pos += 1
+                table.append(pos)
+            self._fast_forward_table = table
+        return self._fast_forward_table
+
+    def offset_for_time(self, timestamp: float) -> Optional[int]:
+        """Byte offset of the last frame at or before the timestamp."""
+        self._ensure_index()
+        times = self._index_times
+        if not times:
+            return None
+
+        # The per-second table narrows the search to one second of frames,
+        # so scrub lookups cost O(1) instead of a full-index bisect
+        table = self.fast_forward_table
+        second = min(max(int(timestamp), 0), len(table) - 1)
+        lo = max(table[second] - 1, 0)
+        hi = table[second + 1] if second + 1 < len(table) else len(times)
+
+        idx = bisect.bisect_right(times, timestamp, lo, hi) - 1
+        return self._index_offsets[max(idx, 0)]
+
     def _parse_header(self) -> CastHeader:
-        """Parse the header line of the cast file."""
+        """Parse the header line of the cast file.
+
+        Reads just the first line with a plain handle - no point mapping
+        the whole file when listing many recordings only needs headers.
+        """
         with open(self._working_file_path, "rb") as f:
-            header_line = f.readline().decode("utf-8").strip()
-            header_data = json.loads(header_line)
+            header_data = _loads(f.readline())
             return CastHeader.from_dict(header_data)
 
     def _calculate_duration(self) -> float:
-        """Calculate the total duration by finding the last timestamp."""
-        last_timestamp = 0.0
-        with open(self._working_file_path, "rb") as f:
-            f.readline()  # Skip header
-            for line in f:
-                line = line.decode("utf-8").strip()
-                if line:
-                    frame_data = json.loads(line)
-                    last_timestamp = frame_data[0]
-        return last_timestamp
+        """Calculate the total duration from the last indexed timestamp."""
+        self._ensure_index()
+        times = self._index_times
+        return times[-1] if times else 0.0
 
     def frames(self) -> Iterator[CastFrame]:
         """Iterate over all frames in the cast file."""
-        with open(self._working_file_path, "rb") as f:
+        with self._open_working_file() as f:
+            _advise_sequential(f)
             f.readline()  # Skip header
-            for line in f:
-                line = line.decode("utf-8").strip()
+            for line in _iter_lines(f):
+                line = line.strip()
                 if line:
-                    frame_data = json.loads(line)
+                    frame_data = _loads(line)
                     timestamp, stream_type, data = frame_data
                     yield CastFrame(timestamp, stream_type, data)
 
     def frames_with_offsets(self) -> Iterator[Tuple[int, CastFrame]]:
         """Iterate over frames with their byte offsets in the file."""
-        with open(self._working_file_path, "rb") as f:
+        with self._open_working_file() as f:
             f.readline()  # Skip header
-            while True:
-                offset = f.tell()
-                line = f.readline()
-                if not line:
-                    break
-                line = line.decode("utf-8").strip()
+            for offset, line in _iter_lines_with_offsets(f, f.tell()):
+                line = line.strip()
                 if line:
-                    frame_data = json.loads(line)
+                    frame_data = _loads(line)
                     timestamp, stream_type, data = frame_data
                     yield offset, CastFrame(timestamp, stream_type, data)
 
     def parse_from_offset(self, offset: int) -> Iterator[CastFrame]:
         """Parse frames starting from a specific byte offset."""
-        with open(self._working_file_path, "rb") as f:
+        with self._open_working_file() as f:
             f.seek(offset)
-            for line in f:
-                line = line.decode("utf-8").strip()
+            for line in _iter_lines(f):
+                line = line.strip()
                 if line:
-                    frame_data = json.loads(line)
+                    frame_data = _loads(line)
                     timestamp, stream_type, data = frame_data
                     yield CastFrame(timestamp, stream_type, data)
 
@@ -178,7 +418,12 @@ class CastParser:
             yield frame
 
     def frames_from(self, start_timestamp: float) -> Iterator[CastFrame]:
-        """Iterate over frames starting from a specific timestamp."""
-        for frame in self.frames():
-            if frame.timestamp >= start_timestamp:
-                yield frame
+        """Iterate over frames starting from a specific timestamp.
+
+        Bisects the frame index for the first qualifying frame and parses
+        from its byte offset, skipping the decode of everything before it.
+        """
+        self._ensure_index()
+        idx = bisect.bisect_left(self._index_times, start_timestamp)
+        if idx < len(self._index_times):
+            yield from self.parse_from_offset(self._index_offsets[idx])
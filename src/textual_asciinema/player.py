@@ -1,5 +1,6 @@
 """Main asciinema player widget."""
 
+from collections import OrderedDict
 from pathlib import Path
 from textual.app import ComposeResult
 from textual.containers import Vertical, VerticalScroll
@@ -10,6 +11,35 @@ from .parser import CastParser
 from .engine import PlaybackEngine
 from .controls import PlayerControls
 
+# CastParser instances shared across players, keyed on (path, mtime);
+# LRU-ordered so rarely reopened recordings age out
+_parser_cache: OrderedDict[tuple[str, int], CastParser] = OrderedDict()
+_PARSER_CACHE_SIZE = 32
+
+
+def _get_parser(cast_path: Path) -> CastParser:
+    """Return a cached CastParser for this cast file.
+
+    Building a parser costs a full-file scan for the frame index (plus a
+    decompression pass for gzipped casts), so constructing several players
+    for the same recording reuses one instance. The mtime in the key makes
+    a rewritten file miss the cache, a parser whose decompressed working
+    copy was cleaned up is rebuilt, and the least recently opened entry is
+    dropped once the cache holds more than a few dozen recordings.
+    """
+    try:
+        key = (str(cast_path.resolve()), cast_path.stat().st_mtime_ns)
+    except OSError:
+        return CastParser(cast_path)
+
+    parser = _parser_cache.get(key)
+    if parser is None or not parser._working_file_path.exists():
+        parser = _parser_cache[key] = CastParser(cast_path)
+    _parser_cache.move_to_end(key)
+    while len(_parser_cache) > _PARSER_CACHE_SIZE:
+        _parser_cache.popitem(last=False)
+    return parser
+
 
 class PlaybackTerminal(TextualTerminal):
     """TextualTerminal configured for playback-only mode."""
@@ -101,17 +131,19 @@ class AsciinemaPlayer(Widget):
     def __init__(self, cast_path: str | Path, **kwargs):
         super().__init__(**kwargs)
         self.cast_path = Path(cast_path)
-        self.parser = CastParser(self.cast_path)
+        self.parser = _get_parser(self.cast_path)
+        header = self.parser.header
+        self._terminal_size = (header.width, header.height)
         self.terminal = None
         self.engine = None
         self.controls = None
 
     def compose(self) -> ComposeResult:
         """Compose the player with terminal and controls."""
-        header = self.parser.header
+        width, height = self._terminal_size
 
         # Create TextualTerminal for proper ANSI rendering
-        self.terminal = PlaybackTerminal(width=header.width, height=header.height, id="asciinema-terminal")
+        self.terminal = PlaybackTerminal(width=width, height=height, id="asciinema-terminal")
 
         # Create playback engine with terminal for direct manipulation
         self.engine = PlaybackEngine(self.parser, self.terminal)
@@ -1,13 +1,45 @@
 """Simplified video file manager for asciinema playback."""
 
-import json
+import bisect
 import logging
-from typing import List
+from array import array
+from collections import Counter
+from typing import List, NamedTuple, Optional
 
-from .parser import CastParser, CastFrame
+from .parser import CastParser, CastFrame, _advise_sequential, _loads
 
 logger = logging.getLogger(__name__)
 
+# Seconds of cast time between keyframes, and the bounds the adaptive
+# interval may move within
+KEYFRAME_INTERVAL = 5.0
+KEYFRAME_INTERVAL_MIN = 1.0
+KEYFRAME_INTERVAL_MAX = 15.0
+
+# Seek replay cost (seconds) the adaptive interval aims for
+SEEK_COST_TARGET = 0.1
+
+# Maximum keyframes held at once; beyond this the least-used is evicted
+KEYFRAME_CAP = 128
+
+# Bytes of frame lines to read per slab in get_frames_until
+READ_SLAB_SIZE = 65536
+
+# Output frames closer together than one display frame are merged
+COALESCE_WINDOW = 1.0 / 60.0
+
+
+class Keyframe(NamedTuple):
+    """A resume point in the cast file for fast seeking.
+
+    The snapshot holds the captured terminal screen at this point, so a
+    seek can repaint it directly instead of replaying from the start.
+    """
+
+    timestamp: float
+    file_offset: int
+    snapshot: Optional[str] = None
+
 
 class VideoFile:
     """Manages asciinema file reading and frame streaming."""
@@ -20,73 +52,239 @@ class VideoFile:
         self._current_file_offset = 0
         self._current_time = 0.0
 
+        # Timestamp of the next unread frame, None at end of file
+        self._next_timestamp: Optional[float] = None
+
+        # Keyframe index stored as parallel arrays: sorted timestamps for
+        # bisect, with offsets and snapshots at the matching positions
+        self._keyframe_times = array("d")
+        self._keyframe_offsets = array("q")
+        self._keyframe_snapshots: list[Optional[str]] = []
+        self._keyframe_hits: Counter = Counter()
+        self._last_keyframe_time = 0.0
+        self._keyframe_interval = KEYFRAME_INTERVAL
+
         self._initialize_file()
 
     def _initialize_file(self) -> None:
         """Initialize file reading."""
         try:
-            # Find first frame offset
-            for offset, frame in self.parser.frames_with_offsets():
-                self._current_file_offset = offset
-                break
-            else:
-                self._current_file_offset = 0
+            # Find first frame offset from the precomputed index
+            first_offset = self.parser.offset_for_time(0.0)
+            self._current_file_offset = first_offset if first_offset is not None else 0
 
-            # Open file at starting position
-            if self._file_handle:
-                self._file_handle.close()
-            self._file_handle = open(self.parser._working_file_path, "rb")
+            # Open once with a buffer matching the read slab size and reuse
+            # the handle on later rewinds
+            if self._file_handle is None or self._file_handle.closed:
+                self._file_handle = open(self.parser._working_file_path, "rb", buffering=READ_SLAB_SIZE)
+                _advise_sequential(self._file_handle)
             self._file_handle.seek(self._current_file_offset)
             self._current_time = 0.0
-            logger.debug(f"VideoFile initialized at offset {self._current_file_offset}")
+            self._last_keyframe_time = 0.0
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"VideoFile initialized at offset {self._current_file_offset}")
 
         except Exception as e:
             logger.error(f"Failed to initialize video file: {e}")
             self._current_file_offset = 0
 
     def get_frames_until(self, target_time: float) -> List[CastFrame]:
-        """Get all frames from current position up to target time."""
+        """Get all frames from current position up to target time.
+
+        Bursts of output frames less than one display frame apart are
+        merged into a single CastFrame - shell recordings are full of
+        sub-millisecond bursts that would otherwise each cost a frame
+        object and a scheduler wakeup for one rendered update.
+        """
         frames = []
         if not self._file_handle:
             return frames
 
+        # Pending run of output frames being coalesced
+        run_parts: list[str] = []
+        run_start = 0.0
+        run_last = 0.0
+
         try:
-            while True:
-                line = self._file_handle.readline()
-                if not line:
+            self._next_timestamp = None
+            file_handle = self._file_handle
+            done = False
+            while not done:
+                # Read a slab of whole lines per syscall rather than one
+                # readline per frame
+                slab_start = file_handle.tell()
+                lines = file_handle.readlines(READ_SLAB_SIZE)
+                if not lines:
                     break
 
-                line_text = line.decode("utf-8").strip()
-                if not line_text:
-                    continue
+                consumed = 0
+                for line in lines:
+                    stripped = line.strip()
+                    if not stripped:
+                        consumed += len(line)
+                        continue
 
-                frame_data = json.loads(line_text)
-                timestamp, stream_type, data = frame_data
+                    frame_data = _loads(stripped)
+                    timestamp, stream_type, data = frame_data
 
-                if timestamp > target_time:
-                    # Seek back to start of this line for next call
-                    self._file_handle.seek(self._file_handle.tell() - len(line))
-                    break
+                    if timestamp > target_time:
+                        # Seek back to start of this line for next call
+                        file_handle.seek(slab_start + consumed)
+                        self._next_timestamp = timestamp
+                        done = True
+                        break
 
-                frames.append(CastFrame(timestamp, stream_type, data))
-                self._current_time = timestamp
+                    if stream_type == "o":
+                        if run_parts and timestamp - run_last >= COALESCE_WINDOW:
+                            frames.append(CastFrame(run_start, "o", "".join(run_parts)))
+                            run_parts.clear()
+                        if not run_parts:
+                            run_start = timestamp
+                        run_parts.append(data)
+                        run_last = timestamp
+                    else:
+                        # Non-output frames (resizes) break the run to keep
+                        # feed ordering intact
+                        if run_parts:
+                            frames.append(CastFrame(run_start, "o", "".join(run_parts)))
+                            run_parts.clear()
+                        frames.append(CastFrame(timestamp, stream_type, data))
+                    self._current_time = timestamp
+                    consumed += len(line)
 
         except Exception as e:
             logger.error(f"Error reading frames: {e}")
 
+        if run_parts:
+            frames.append(CastFrame(run_start, "o", "".join(run_parts)))
+
         return frames
 
-    def seek_to_time(self, target_time: float) -> None:
-        """Seek to a specific timestamp (simple implementation - restart from beginning)."""
+    @property
+    def next_frame_time(self) -> Optional[float]:
+        """Timestamp of the next unread frame, or None at end of file."""
+        return self._next_timestamp
+
+    def _create_keyframe(self, timestamp: float, file_offset: int, snapshot: Optional[str] = None) -> None:
+        """Record a keyframe at the given timestamp and file offset."""
+        idx = bisect.bisect_left(self._keyframe_times, timestamp)
+        if idx >= len(self._keyframe_times) or self._keyframe_times[idx] != timestamp:
+            self._keyframe_times.insert(idx, timestamp)
+            self._keyframe_offsets.insert(idx, file_offset)
+            self._keyframe_snapshots.insert(idx, snapshot)
+            if len(self._keyframe_times) > KEYFRAME_CAP:
+                self._evict_keyframe(protect=timestamp)
+        self._last_keyframe_time = timestamp
+
+    def _evict_keyframe(self, protect: float) -> None:
+        """Drop the least-hit keyframe so the index stays bounded.
+
+        Snapshots are whole captured screens, so an unbounded index on a
+        long, heavily-scrubbed cast costs real memory. The freshly created
+        keyframe is protected so it can earn hits before competing.
+        """
+        hits = self._keyframe_hits
+        victim = -1
+        victim_hits = 0
+        for i, ts in enumerate(self._keyframe_times):
+            if ts == protect:
+                continue
+            h = hits[ts]
+            if victim < 0 or h < victim_hits:
+                victim, victim_hits = i, h
+        if victim >= 0:
+            hits.pop(self._keyframe_times[victim], None)
+            del self._keyframe_times[victim]
+            del self._keyframe_offsets[victim]
+            del self._keyframe_snapshots[victim]
+
+    def maybe_create_keyframe(self, snapshot_provider=None) -> None:
+        """Record a keyframe at the current stream position if one is due.
+
+        Called by the engine after it has fed everything up to the current
+        time, so snapshot_provider captures exactly the state at this point.
+        """
+        if not self._file_handle:
+            return
+        if self._current_time - self._last_keyframe_time >= self._keyframe_interval:
+            snapshot = snapshot_provider() if snapshot_provider else None
+            self._create_keyframe(self._current_time, self._file_handle.tell(), snapshot)
+
+    def warm_keyframe_here(self, snapshot_provider=None) -> None:
+        """Drop a keyframe at the current position after a seek lands.
+
+        Scrubbing tends to revisit the neighbourhood it is already in, so
+        pre-warming a snapshot at the landing point lets nearby seeks in
+        either direction resume with little or no replay. Skipped when a
+        keyframe already sits close enough behind us.
+        """
+        if not self._file_handle:
+            return
+        nearest = self._find_nearest_keyframe(self._current_time)
+        if nearest is not None and self._current_time - nearest.timestamp < KEYFRAME_INTERVAL_MIN:
+            return
+        snapshot = snapshot_provider() if snapshot_provider else None
+        self._create_keyframe(self._current_time, self._file_handle.tell(), snapshot)
+
+    def adapt_keyframe_interval(self, seek_cost: float) -> None:
+        """Adjust keyframe density toward the target seek replay cost.
+
+        Expensive seeks tighten the interval so future replays are shorter;
+        cheap ones relax it to keep snapshot memory down. Changes are damped
+        to half/double per observation.
+        """
+        if seek_cost <= 0:
+            return
+        scale = max(0.5, min(SEEK_COST_TARGET / seek_cost, 2.0))
+        self._keyframe_interval = max(
+            KEYFRAME_INTERVAL_MIN, min(self._keyframe_interval * scale, KEYFRAME_INTERVAL_MAX)
+        )
+
+    def _find_nearest_keyframe(self, target_time: float) -> Optional[Keyframe]:
+        """Find the keyframe with the largest timestamp <= target_time."""
+        idx = bisect.bisect_right(self._keyframe_times, target_time) - 1
+        if idx >= 0:
+            timestamp = self._keyframe_times[idx]
+            self._keyframe_hits[timestamp] += 1
+            return Keyframe(timestamp, self._keyframe_offsets[idx], self._keyframe_snapshots[idx])
+        return None
+
+    def seek_to_time(self, target_time: float) -> tuple[Optional[Keyframe], List[CastFrame]]:
+        """Seek to a specific timestamp, resuming from the nearest keyframe.
+
+        Returns the keyframe resumed from (None when restarting from the
+        beginning) and the frames between the resume point and the target,
+        so the caller can repaint the snapshot and replay the remainder.
+        """
+        keyframe = self._find_nearest_keyframe(target_time)
+        resumed_from: Optional[Keyframe] = None
+
         if target_time < self._current_time:
-            # Seeking backwards - restart from beginning
-            self._initialize_file()
+            if keyframe is not None and self._file_handle:
+                # Resume from the nearest keyframe before the target
+                self._file_handle.seek(keyframe.file_offset)
+                self._current_time = keyframe.timestamp
+                self._last_keyframe_time = keyframe.timestamp
+                resumed_from = keyframe
+            else:
+                # No keyframe yet - restart from beginning
+                self._initialize_file()
+        elif keyframe is not None and keyframe.timestamp > self._current_time and self._file_handle:
+            # Skip ahead past frames we already have a keyframe for
+            self._file_handle.seek(keyframe.file_offset)
+            self._current_time = keyframe.timestamp
+            self._last_keyframe_time = keyframe.timestamp
+            resumed_from = keyframe
 
-        # Skip frames until we reach target time
-        self.get_frames_until(target_time)
+        # Replay frames from the resume point up to the target time
+        return resumed_from, self.get_frames_until(target_time)
 
     def cleanup(self) -> None:
         """Clean up resources."""
+        del self._keyframe_times[:]
+        del self._keyframe_offsets[:]
+        self._keyframe_snapshots.clear()
+        self._keyframe_hits.clear()
         if self._file_handle:
             self._file_handle.close()
 
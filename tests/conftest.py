@@ -0,0 +1,42 @@
+"""Shared fixtures and test fakes."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep decompressed casts and index sidecars out of the user's cache.
+
+    Every parser construction writes there otherwise, and sidecar names
+    hash the per-run tmp_path, so test runs would leak orphaned .idx
+    files into the real cache directory forever.
+    """
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setattr("textual_asciinema.parser.user_cache_dir", lambda *args, **kwargs: str(cache_dir))
+    return cache_dir
+
+
+class FakeEngine:
+    """Minimal PlaybackEngine stand-in that records calls.
+
+    Plain methods avoid the dynamic attribute overhead of Mock/AsyncMock
+    and the unawaited-coroutine warnings AsyncMock leaves behind.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    async def play(self):
+        self.calls.append("play")
+
+    async def pause(self):
+        self.calls.append("pause")
+
+    async def toggle_play_pause(self):
+        self.calls.append("toggle_play_pause")
+
+    async def seek_to(self, timestamp):
+        self.calls.append(("seek_to", timestamp))
+
+    def set_speed(self, speed):
+        self.calls.append(("set_speed", speed))
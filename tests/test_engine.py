@@ -1,8 +1,47 @@
 """Tests for the PlaybackEngine - simplified to test real functionality."""
 
-from unittest.mock import Mock
+import asyncio
+import json
+from pathlib import Path
 
 from textual_asciinema.engine import PlaybackEngine
+from textual_asciinema.parser import CastParser
+
+
+class FakeStreamParser:
+    """Terminal stream parser stand-in."""
+
+    def feed(self, data):
+        pass
+
+
+class FakeTerminal:
+    """Bare terminal stand-in covering the seek and replay paths."""
+
+    def __init__(self):
+        self.parser = FakeStreamParser()
+
+    def clear_screen(self):
+        pass
+
+    def capture_pane(self):
+        return "screen"
+
+    def resize(self, cols, rows):
+        pass
+
+    async def _update_display(self):
+        pass
+
+
+class FakeParser:
+    """Bare parser stand-in; VideoFile tolerates the missing file."""
+
+    duration = 10.0
+    _working_file_path = Path("/nonexistent.cast")
+
+    def offset_for_time(self, timestamp):
+        return None
 
 
 class TestPlaybackEngine:
@@ -19,15 +58,7 @@ class TestPlaybackEngine:
 
     def test_speed_control(self):
         """Test speed control works."""
-        # Create minimal mock terminal
-        mock_terminal = Mock()
-        mock_terminal.clear_screen = Mock()
-
-        # Create minimal mock parser
-        mock_parser = Mock()
-        mock_parser.duration = 10.0
-
-        engine = PlaybackEngine(mock_parser, mock_terminal)
+        engine = PlaybackEngine(FakeParser(), FakeTerminal())
 
         # Test speed changes
         engine.set_speed(2.0)
@@ -38,15 +69,31 @@ class TestPlaybackEngine:
 
     def test_basic_state(self):
         """Test basic engine state."""
-        mock_terminal = Mock()
-        mock_terminal.clear_screen = Mock()
-        mock_parser = Mock()
-        mock_parser.duration = 10.0
-
-        engine = PlaybackEngine(mock_parser, mock_terminal)
+        engine = PlaybackEngine(FakeParser(), FakeTerminal())
 
         # Test initial state
         assert engine.current_time == 0.0
         assert not engine.is_playing
         assert engine.speed == 1.0
         assert engine.video_file is not None
+
+    def test_rapid_forward_seeks_advance(self, tmp_path):
+        """Repeated forward seeks inside the scrub window keep advancing.
+
+        Each seek warms a keyframe at its landing point; the scrub
+        heuristic must not snap the next forward seek back onto it.
+        """
+        lines = [json.dumps({"version": 2, "width": 80, "height": 24})]
+        for i in range(30):
+            lines.append(json.dumps([float(i), "o", f"frame {i}\r\n"]))
+        cast_path = tmp_path / "long.cast"
+        cast_path.write_text("\n".join(lines) + "\n")
+
+        engine = PlaybackEngine(CastParser(cast_path), FakeTerminal())
+
+        asyncio.run(engine.seek_to(5.0))
+        for _ in range(5):
+            # Issued faster than SCRUB_WINDOW_NS, like a held arrow key
+            asyncio.run(engine.seek_to(engine.current_time + 1.0))
+
+        assert engine.current_time == 10.0
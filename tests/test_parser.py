@@ -8,7 +8,7 @@ import pytest
 from textual_asciinema.parser import CastParser, CastFrame
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cast_data():
     """Sample cast data for testing."""
     header = {
@@ -30,31 +30,27 @@ def sample_cast_data():
     return header, frames
 
 
-@pytest.fixture
-def cast_file(sample_cast_data, tmp_path):
-    """Create a temporary cast file."""
+@pytest.fixture(scope="session")
+def cast_payload(sample_cast_data):
+    """Serialize the sample cast once per session."""
     header, frames = sample_cast_data
-    cast_path = tmp_path / "test.cast"
+    lines = [json.dumps(header)] + [json.dumps(frame) for frame in frames]
+    return ("\n".join(lines) + "\n").encode()
 
-    with open(cast_path, "w") as f:
-        f.write(json.dumps(header) + "\n")
-        for frame in frames:
-            f.write(json.dumps(frame) + "\n")
 
+@pytest.fixture
+def cast_file(cast_payload, tmp_path):
+    """Create a temporary cast file."""
+    cast_path = tmp_path / "test.cast"
+    cast_path.write_bytes(cast_payload)
     return cast_path
 
 
 @pytest.fixture
-def gzipped_cast_file(sample_cast_data, tmp_path):
+def gzipped_cast_file(cast_payload, tmp_path):
     """Create a temporary gzipped cast file."""
-    header, frames = sample_cast_data
     cast_path = tmp_path / "test.cast.gz"
-
-    with gzip.open(cast_path, "wt") as f:
-        f.write(json.dumps(header) + "\n")
-        for frame in frames:
-            f.write(json.dumps(frame) + "\n")
-
+    cast_path.write_bytes(gzip.compress(cast_payload, compresslevel=1))
     return cast_path
 
 
@@ -134,6 +130,30 @@ def test_frames_until(cast_file):
         assert frames[1].timestamp == 0.5
 
 
+def test_frame_index(cast_file):
+    """Test the precomputed timestamp/offset index."""
+    with CastParser(cast_file) as parser:
+        index = parser.frame_index
+
+        assert len(index) == 4
+        assert [timestamp for timestamp, _ in index] == [0.0, 0.5, 1.0, 1.5]
+        # Offsets match the slower streaming scan
+        assert index == [(frame.timestamp, offset) for offset, frame in parser.frames_with_offsets()]
+
+
+def test_offset_for_time(cast_file):
+    """Test bisect lookup of the last frame at or before a timestamp."""
+    with CastParser(cast_file) as parser:
+        index = parser.frame_index
+
+        # Exact hits, in-between times and out-of-range times
+        assert parser.offset_for_time(0.0) == index[0][1]
+        assert parser.offset_for_time(0.7) == index[1][1]
+        assert parser.offset_for_time(1.5) == index[3][1]
+        assert parser.offset_for_time(99.0) == index[3][1]
+        assert parser.offset_for_time(-1.0) == index[0][1]
+
+
 def test_frames_from(cast_file):
     """Test getting frames from a specific timestamp."""
     with CastParser(cast_file) as parser:
@@ -142,3 +162,34 @@ def test_frames_from(cast_file):
         assert len(frames) == 2
         assert frames[0].timestamp == 1.0
         assert frames[1].timestamp == 1.5
+
+
+def test_index_cache_roundtrip(cast_file, tmp_path, monkeypatch):
+    """Test persisting and reloading the frame index sidecar."""
+    sidecar = tmp_path / "cache" / "test.idx"
+    monkeypatch.setattr(CastParser, "_index_cache_path", lambda self: sidecar)
+
+    with CastParser(cast_file) as parser:
+        index = parser.frame_index
+    assert sidecar.exists()
+
+    # A fresh parser loads the index from the sidecar
+    with CastParser(cast_file) as parser:
+        timestamps, offsets = parser._load_index_cache()
+        assert list(zip(timestamps, offsets)) == index
+        assert parser.frame_index == index
+
+    # Touching the cast file invalidates the sidecar
+    cast_file.touch()
+    with CastParser(cast_file) as parser:
+        assert parser._load_index_cache() is None
+        assert parser.frame_index == index
+
+
+def test_index_arrays(cast_file):
+    """Test the packed column view of the frame index."""
+    with CastParser(cast_file) as parser:
+        timestamps, offsets = parser.index_arrays()
+
+        assert list(timestamps) == [0.0, 0.5, 1.0, 1.5]
+        assert list(zip(timestamps, offsets)) == parser.frame_index
@@ -2,18 +2,26 @@
 
 import gzip
 import json
+import re
 from pathlib import Path
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock
 
 import pytest
 
+from conftest import FakeEngine
 from textual_asciinema.player import AsciinemaPlayer, PlaybackTerminal
 from textual_asciinema.parser import CastParser
 
 
-@pytest.fixture
-def sample_cast_file(tmp_path):
-    """Create a sample cast file for testing."""
+def _serialize_cast(header, frames):
+    """Serialize a header and frames to cast file bytes."""
+    lines = [json.dumps(header)] + [json.dumps(frame) for frame in frames]
+    return ("\n".join(lines) + "\n").encode()
+
+
+@pytest.fixture(scope="session")
+def sample_cast_payload():
+    """Serialize the sample cast once per session."""
     header = {
         "version": 2,
         "width": 80,
@@ -26,19 +34,12 @@ def sample_cast_file(tmp_path):
         [1.0, "o", "World!"],
         [2.0, "o", "\r\n"],
     ]
+    return _serialize_cast(header, frames)
 
-    cast_path = tmp_path / "test.cast"
-    with open(cast_path, "w") as f:
-        f.write(json.dumps(header) + "\n")
-        for frame in frames:
-            f.write(json.dumps(frame) + "\n")
 
-    return cast_path
-
-
-@pytest.fixture
-def gzipped_cast_file(tmp_path):
-    """Create a gzipped cast file for testing."""
+@pytest.fixture(scope="session")
+def gzipped_cast_payload():
+    """Serialize and compress the gzipped sample cast once per session."""
     header = {
         "version": 2,
         "width": 120,
@@ -50,13 +51,22 @@ def gzipped_cast_file(tmp_path):
         [0.0, "o", "Compressed "],
         [1.5, "o", "data!"],
     ]
+    return gzip.compress(_serialize_cast(header, frames), compresslevel=1)
 
-    cast_path = tmp_path / "test.cast.gz"
-    with gzip.open(cast_path, "wt") as f:
-        f.write(json.dumps(header) + "\n")
-        for frame in frames:
-            f.write(json.dumps(frame) + "\n")
 
+@pytest.fixture
+def sample_cast_file(sample_cast_payload, tmp_path):
+    """Create a sample cast file for testing."""
+    cast_path = tmp_path / "test.cast"
+    cast_path.write_bytes(sample_cast_payload)
+    return cast_path
+
+
+@pytest.fixture
+def gzipped_cast_file(gzipped_cast_payload, tmp_path):
+    """Create a gzipped cast file for testing."""
+    cast_path = tmp_path / "test.cast.gz"
+    cast_path.write_bytes(gzipped_cast_payload)
     return cast_path
 
 
@@ -123,9 +133,8 @@ class TestAsciinemaPlayer:
         # Mock run_worker method
         player.run_worker = Mock()
 
-        # Create mock engine to avoid compose() call
-        player.engine = Mock()
-        player.engine.toggle_play_pause = AsyncMock()
+        # Use a fake engine to avoid compose() call
+        player.engine = FakeEngine()
 
         # Call the sync wrapper
         player._handle_play_pause()
@@ -134,6 +143,7 @@ class TestAsciinemaPlayer:
         player.run_worker.assert_called_once()
         call_args = player.run_worker.call_args[0][0]
         assert hasattr(call_args, "__await__")  # Is a coroutine
+        call_args.close()
 
     def test_handle_seek_sync_wrapper(self, sample_cast_file):
         """Test seek sync wrapper method."""
@@ -142,9 +152,8 @@ class TestAsciinemaPlayer:
         # Mock run_worker method
         player.run_worker = Mock()
 
-        # Create mock engine to avoid compose() call
-        player.engine = Mock()
-        player.engine.seek_to = AsyncMock()
+        # Use a fake engine to avoid compose() call
+        player.engine = FakeEngine()
 
         # Call the sync wrapper
         player._handle_seek(42.0)
@@ -153,6 +162,7 @@ class TestAsciinemaPlayer:
         player.run_worker.assert_called_once()
         call_args = player.run_worker.call_args[0][0]
         assert hasattr(call_args, "__await__")  # Is a coroutine
+        call_args.close()
 
     def test_methods_with_no_engine(self, sample_cast_file):
         """Test public set_speed method handles missing engine gracefully."""
@@ -225,19 +235,23 @@ class TestAsciinemaPlayer:
         """Test that CSS is properly defined."""
         css = AsciinemaPlayer.DEFAULT_CSS
 
-        # Should contain key selectors
-        assert "#asciinema-terminal" in css
-        assert "#asciinema-controls" in css
-        assert "#controls-container" in css
-        assert "#play-pause-btn" in css
-        assert "#timeline-scrubber" in css
-        assert "#time-display" in css
-        assert "#speed-display" in css
-
-        # Should contain important properties
-        assert "border: solid white" in css
-        assert "dock: bottom" in css
-        assert "height: 3" in css
+        # Key selectors and important properties, checked in one regex
+        # pass over the stylesheet rather than a scan per substring
+        required = {
+            "#asciinema-terminal",
+            "#asciinema-controls",
+            "#controls-container",
+            "#play-pause-btn",
+            "#timeline-scrubber",
+            "#time-display",
+            "#speed-display",
+            "border: solid white",
+            "dock: bottom",
+            "height: 3",
+        }
+        pattern = re.compile("|".join(map(re.escape, required)))
+        missing = required - set(pattern.findall(css))
+        assert not missing, f"DEFAULT_CSS missing: {sorted(missing)}"
 
 
 class TestAsciinemaPlayerIntegration:
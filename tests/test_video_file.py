@@ -0,0 +1,93 @@
+"""Tests for the VideoFile frame streaming and keyframe index."""
+
+import json
+
+import pytest
+
+from textual_asciinema.parser import CastParser
+from textual_asciinema.video_file import VideoFile
+
+
+@pytest.fixture(scope="session")
+def long_cast_payload():
+    """Serialize a cast long enough to generate keyframes, once per session."""
+    lines = [json.dumps({"version": 2, "width": 80, "height": 24})]
+    for i in range(30):
+        lines.append(json.dumps([float(i), "o", f"frame {i}\r\n"]))
+    return ("\n".join(lines) + "\n").encode()
+
+
+@pytest.fixture
+def long_cast_file(long_cast_payload, tmp_path):
+    """Create a cast file long enough to generate keyframes."""
+    cast_path = tmp_path / "long.cast"
+    cast_path.write_bytes(long_cast_payload)
+    return cast_path
+
+
+class TestVideoFile:
+    """Test the VideoFile class."""
+
+    def test_get_frames_until(self, long_cast_file):
+        """Test reading frames up to a timestamp."""
+        with CastParser(long_cast_file) as parser:
+            video = VideoFile(parser)
+            frames = video.get_frames_until(2.5)
+
+            assert len(frames) == 3
+            assert frames[0].timestamp == 0.0
+            assert frames[-1].timestamp == 2.0
+
+            # Subsequent reads continue from where we left off
+            frames = video.get_frames_until(4.0)
+            assert [f.timestamp for f in frames] == [3.0, 4.0]
+            video.cleanup()
+
+    def test_keyframes_created_during_playback(self, long_cast_file):
+        """Test that keyframes are recorded at tick boundaries."""
+        with CastParser(long_cast_file) as parser:
+            video = VideoFile(parser)
+            for tick in range(30):
+                video.get_frames_until(float(tick))
+                video.maybe_create_keyframe(lambda: "snapshot")
+
+            assert len(video._keyframe_times) > 0
+            assert list(video._keyframe_times) == sorted(video._keyframe_times)
+            assert all(snapshot == "snapshot" for snapshot in video._keyframe_snapshots)
+            video.cleanup()
+
+    def test_find_nearest_keyframe(self, long_cast_file):
+        """Test bisect lookup of the nearest keyframe."""
+        with CastParser(long_cast_file) as parser:
+            video = VideoFile(parser)
+            for tick in range(30):
+                video.get_frames_until(float(tick))
+                video.maybe_create_keyframe()
+
+            keyframe = video._find_nearest_keyframe(12.3)
+            assert keyframe is not None
+            assert keyframe.timestamp <= 12.3
+
+            # Before any keyframe there is nothing to snap to
+            assert video._find_nearest_keyframe(-1.0) is None
+            video.cleanup()
+
+    def test_seek_backwards_uses_keyframe(self, long_cast_file):
+        """Test that backward seeks resume from a keyframe, not the start."""
+        with CastParser(long_cast_file) as parser:
+            video = VideoFile(parser)
+            for tick in range(30):
+                video.get_frames_until(float(tick))
+                video.maybe_create_keyframe(lambda: "snapshot")
+
+            keyframe, replayed = video.seek_to_time(12.0)
+            assert keyframe is not None
+            assert keyframe.snapshot == "snapshot"
+            assert keyframe.timestamp <= 12.0
+            assert all(frame.timestamp <= 12.0 for frame in replayed)
+            assert video._current_time == 12.0
+
+            # Reading continues from the seek target
+            frames = video.get_frames_until(13.0)
+            assert [f.timestamp for f in frames] == [13.0]
+            video.cleanup()